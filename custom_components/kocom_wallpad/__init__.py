@@ -7,7 +7,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 
 from .gateway import KocomGateway
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN
 
 
 PLATFORMS: list[Platform] = [
@@ -29,6 +29,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
     
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = gateway
+    # Restored packets must seed the gateway before the client starts handling
+    # live traffic, and both must finish before the platforms read the gateway.
     await gateway.async_update_entity_registry()
     await gateway.async_start()
 
@@ -2,24 +2,25 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from typing import Final
+
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
 )
 
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, HassJob, HassJobType, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .pywallpad.const import STATE, CODE, TIME
-from .pywallpad.enums import DeviceType
-from .pywallpad.packet import KocomPacket
+from .pywallpad.packet import KocomPacket, MotionPacket, DoorPhonePacket
 
 from .gateway import KocomGateway
 from .entity import KocomEntity
-from .const import DOMAIN, LOGGER, DEVICE_TYPE, ROOM_ID, SUB_ID
+from .const import DOMAIN
 
 
 async def async_setup_entry(
@@ -30,22 +31,34 @@ async def async_setup_entry(
     """Set up Kocom binary sensor platform."""
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
+    def create_binary_sensor(packet: KocomPacket) -> KocomEntity:
+        """Create the binary sensor entity matching the packet type."""
+        entity_class = BINARY_SENSOR_ENTITIES.get(type(packet), KocomBinarySensorEntity)
+        return entity_class(gateway, packet)
+
     @callback
-    def async_add_binary_sensor(packet: KocomPacket) -> None:
-        """Add new binary sensor entity."""
-        async_add_entities([KocomBinarySensorEntity(gateway, packet)])
-    
-    for entity in gateway.get_entities(Platform.BINARY_SENSOR):
-        async_add_binary_sensor(entity)
-        
+    def async_add_binary_sensor(packets: Iterable[KocomPacket]) -> None:
+        """Add new binary sensor entities."""
+        async_add_entities([
+            create_binary_sensor(packet) for packet in packets
+        ])
+
+    async_add_binary_sensor(gateway.get_entities(Platform.BINARY_SENSOR))
+
     entry.async_on_unload(
-        async_dispatcher_connect(hass, f"{DOMAIN}_binary_sensor_add", async_add_binary_sensor)
+        gateway.register_platform(
+            Platform.BINARY_SENSOR,
+            HassJob(async_add_binary_sensor, "kocom add binary_sensor", job_type=HassJobType.Callback),
+        )
     )
 
 
 class KocomBinarySensorEntity(KocomEntity, BinarySensorEntity):
     """Representation of a Kocom binary sensor."""
 
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _state_attribute = CODE
+
     def __init__(
         self,
         gateway: KocomGateway,
@@ -53,19 +66,37 @@ class KocomBinarySensorEntity(KocomEntity, BinarySensorEntity):
     ) -> None:
         """Initialize the binary sensor."""
         super().__init__(gateway, packet)
-        self._attr_is_on = self.packet._device.state[STATE]
+        self._device_attributes = self._attr_extra_state_attributes
+        self._update_attrs()
+
+    def _update_attrs(self) -> None:
+        """Update the cached binary sensor attributes from the device state."""
         self._attr_extra_state_attributes = {
-            DEVICE_TYPE: self.packet._device.device_type,
-            ROOM_ID: self.packet._device.room_id,
-            SUB_ID: self.packet._device.sub_id,
+            **self._device_attributes,
+            self._state_attribute: self._device_state[self._state_attribute],
         }
 
-        if self.packet.device_type == DeviceType.MOTION:
-            self._attr_device_class = BinarySensorDeviceClass.MOTION
-            self._attr_extra_state_attributes[TIME] = self.packet._device.state[TIME]
-        elif self.packet.device_type == "doorphone":
-            self._attr_device_class = BinarySensorDeviceClass.SOUND
-            self._attr_extra_state_attributes[TIME] = self.packet._device.state[TIME]
-        else:
-            self._attr_device_class = BinarySensorDeviceClass.PROBLEM
-            self._attr_extra_state_attributes[CODE] = self.packet._device.state[CODE]
+    @property
+    def is_on(self) -> bool:
+        """Return true if the binary sensor is on."""
+        return self._device_state[STATE]
+
+
+class KocomMotionSensorEntity(KocomBinarySensorEntity):
+    """Representation of a Kocom motion sensor."""
+
+    _attr_device_class = BinarySensorDeviceClass.MOTION
+    _state_attribute = TIME
+
+
+class KocomDoorPhoneSensorEntity(KocomBinarySensorEntity):
+    """Representation of a Kocom door phone ring sensor."""
+
+    _attr_device_class = BinarySensorDeviceClass.SOUND
+    _state_attribute = TIME
+
+
+BINARY_SENSOR_ENTITIES: Final[dict[type[KocomPacket], type[KocomEntity]]] = {
+    MotionPacket: KocomMotionSensorEntity,
+    DoorPhonePacket: KocomDoorPhoneSensorEntity,
+}
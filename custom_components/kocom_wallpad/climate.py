@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from typing import Final
+
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import (
     ClimateEntityFeature,
@@ -14,10 +17,9 @@ from homeassistant.components.climate.const import (
 )
 
 from homeassistant.const import Platform, UnitOfTemperature, ATTR_TEMPERATURE
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, HassJob, HassJobType, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .pywallpad.const import (
     POWER,
@@ -31,7 +33,33 @@ from .pywallpad.packet import KocomPacket, ThermostatPacket, ACPacket
 
 from .gateway import KocomGateway
 from .entity import KocomEntity
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN
+
+HVAC_TO_POWER: Final[dict[HVACMode, bool]] = {
+    HVACMode.OFF: False,
+    HVACMode.HEAT: True,
+}
+PRESET_TO_AWAY: Final[dict[str, bool]] = {
+    PRESET_AWAY: True,
+    PRESET_NONE: False,
+}
+OPER_MODE_TO_HVAC: Final[dict[ACPacket.OperMode, HVACMode]] = {
+    ACPacket.OperMode.COOL: HVACMode.COOL,
+    ACPacket.OperMode.FAN_ONLY: HVACMode.FAN_ONLY,
+    ACPacket.OperMode.DRY: HVACMode.DRY,
+    ACPacket.OperMode.AUTO: HVACMode.AUTO,
+}
+HVAC_TO_OPER_MODE: Final[dict[HVACMode, ACPacket.OperMode]] = {
+    hvac_mode: oper_mode for oper_mode, hvac_mode in OPER_MODE_TO_HVAC.items()
+}
+FAN_MODE_TO_HA: Final[dict[ACPacket.FanMode, str]] = {
+    ACPacket.FanMode.LOW: FAN_LOW,
+    ACPacket.FanMode.MEDIUM: FAN_MEDIUM,
+    ACPacket.FanMode.HIGH: FAN_HIGH,
+}
+HA_TO_FAN_MODE: Final[dict[str, ACPacket.FanMode]] = {
+    fan_mode: ac_fan_mode for ac_fan_mode, fan_mode in FAN_MODE_TO_HA.items()
+}
 
 
 async def async_setup_entry(
@@ -42,19 +70,28 @@ async def async_setup_entry(
     """Set up Kocom climate platform."""
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
+    def create_climate(packet: KocomPacket) -> KocomEntity | None:
+        """Create the climate entity matching the packet type."""
+        if (entity_class := CLIMATE_ENTITIES.get(type(packet))) is None:
+            return None
+        return entity_class(gateway, packet)
+
     @callback
-    def async_add_climate(packet: KocomPacket) -> None:
-        """Add new climate entity."""
-        if isinstance(packet, ThermostatPacket):
-            async_add_entities([KocomThermostatEntity(gateway, packet)])
-        elif isinstance(packet, ACPacket):
-            async_add_entities([KocomACEntity(gateway, packet)])
-    
-    for entity in gateway.get_entities(Platform.CLIMATE):
-        async_add_climate(entity)
-        
+    def async_add_climate(packets: Iterable[KocomPacket]) -> None:
+        """Add new climate entities."""
+        async_add_entities([
+            entity
+            for packet in packets
+            if (entity := create_climate(packet)) is not None
+        ])
+
+    async_add_climate(gateway.get_entities(Platform.CLIMATE))
+
     entry.async_on_unload(
-        async_dispatcher_connect(hass, f"{DOMAIN}_climate_add", async_add_climate)
+        gateway.register_platform(
+            Platform.CLIMATE,
+            HassJob(async_add_climate, "kocom add climate", job_type=HassJobType.Callback),
+        )
     )
 
 
@@ -82,30 +119,26 @@ class KocomThermostatEntity(KocomEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current HVAC mode."""
-        return HVACMode.HEAT if self.packet._device.state[POWER] else HVACMode.OFF
+        return HVACMode.HEAT if self._device_state[POWER] else HVACMode.OFF
 
     @property
     def preset_mode(self) -> str:
         """Return the current preset mode."""
-        return PRESET_AWAY if self.packet._device.state[AWAY] else PRESET_NONE
+        return PRESET_AWAY if self._device_state[AWAY] else PRESET_NONE
 
     @property
     def current_temperature(self) -> int:
         """Return the current temperature."""
-        return self.packet._device.state[CURRENT_TEMP]
+        return self._device_state[CURRENT_TEMP]
 
     @property
     def target_temperature(self) -> int:
         """Return the target temperature."""
-        return self.packet._device.state[TARGET_TEMP]
+        return self._device_state[TARGET_TEMP]
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the HVAC mode."""
-        hvac_to_power = {
-            HVACMode.OFF: False,
-            HVACMode.HEAT: True,
-        }
-        power = hvac_to_power.get(hvac_mode)
+        power = HVAC_TO_POWER.get(hvac_mode)
         if power is None:
             raise ValueError(f"Unknown HVAC mode: {hvac_mode}")
 
@@ -114,11 +147,7 @@ class KocomThermostatEntity(KocomEntity, ClimateEntity):
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode."""
-        preset_to_away = {
-            PRESET_AWAY: True,
-            PRESET_NONE: False,
-        }
-        away_mode = preset_to_away.get(preset_mode)
+        away_mode = PRESET_TO_AWAY.get(preset_mode)
         if away_mode is None:
             raise ValueError(f"Unknown preset mode: {preset_mode}")
 
@@ -130,7 +159,8 @@ class KocomThermostatEntity(KocomEntity, ClimateEntity):
         if ATTR_TEMPERATURE not in kwargs:
             raise ValueError("Missing temperature")
         
-        target_temp = int(kwargs[ATTR_TEMPERATURE])
+        temperature = kwargs[ATTR_TEMPERATURE]
+        target_temp = temperature if type(temperature) is int else round(temperature)
         make_packet = self.packet.make_target_temp(target_temp)
         await self.send_packet(make_packet)
 
@@ -165,47 +195,31 @@ class KocomACEntity(KocomEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
-        if self.packet._device.state[POWER]:
-            oper_mode = self.packet._device.state[OPER_MODE]
-            return {
-                ACPacket.OperMode.COOL: HVACMode.COOL,
-                ACPacket.OperMode.FAN_ONLY: HVACMode.FAN_ONLY,
-                ACPacket.OperMode.DRY: HVACMode.DRY,
-                ACPacket.OperMode.AUTO: HVACMode.AUTO,
-            }.get(oper_mode, HVACMode.OFF)
+        if self._device_state[POWER]:
+            return OPER_MODE_TO_HVAC.get(self._device_state[OPER_MODE], HVACMode.OFF)
         return HVACMode.OFF
 
     @property
     def fan_mode(self) -> str:
         """Return current fan mode."""
-        return {
-            ACPacket.FanMode.LOW: FAN_LOW,
-            ACPacket.FanMode.MEDIUM: FAN_MEDIUM,
-            ACPacket.FanMode.HIGH: FAN_HIGH,
-        }.get(self.packet._device.state[FAN_MODE])
+        return FAN_MODE_TO_HA.get(self._device_state[FAN_MODE])
 
     @property
     def current_temperature(self) -> int:
         """Return the current temperature."""
-        return self.packet._device.state[CURRENT_TEMP]
+        return self._device_state[CURRENT_TEMP]
 
     @property
     def target_temperature(self) -> int:
         """Return the target temperature."""
-        return self.packet._device.state[TARGET_TEMP]
+        return self._device_state[TARGET_TEMP]
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set a new target HVAC mode."""
         if hvac_mode == HVACMode.OFF:
             make_packet = self.packet.make_power_status(False)
         else:
-            hvac_to_oper_mode = {
-                HVACMode.COOL: ACPacket.OperMode.COOL,
-                HVACMode.FAN_ONLY: ACPacket.OperMode.FAN_ONLY,
-                HVACMode.DRY: ACPacket.OperMode.DRY,
-                HVACMode.AUTO: ACPacket.OperMode.AUTO,
-            }
-            oper_mode = hvac_to_oper_mode.get(hvac_mode)
+            oper_mode = HVAC_TO_OPER_MODE.get(hvac_mode)
             if oper_mode is None:
                 raise ValueError(f"Unknown HVAC mode: {hvac_mode}")
             make_packet = self.packet.make_oper_mode(oper_mode)
@@ -214,11 +228,7 @@ class KocomACEntity(KocomEntity, ClimateEntity):
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set a new target fan mode."""
-        fan_speed = {
-            FAN_LOW: ACPacket.FanMode.LOW,
-            FAN_MEDIUM: ACPacket.FanMode.MEDIUM,
-            FAN_HIGH: ACPacket.FanMode.HIGH,
-        }.get(fan_mode)
+        fan_speed = HA_TO_FAN_MODE.get(fan_mode)
         if fan_speed is None:
             raise ValueError(f"Unknown fan mode: {fan_mode}")
 
@@ -230,6 +240,13 @@ class KocomACEntity(KocomEntity, ClimateEntity):
         if ATTR_TEMPERATURE not in kwargs:
             raise ValueError("Missing temperature")
         
-        target_temp = int(kwargs[ATTR_TEMPERATURE])
+        temperature = kwargs[ATTR_TEMPERATURE]
+        target_temp = temperature if type(temperature) is int else round(temperature)
         make_packet = self.packet.make_target_temp(target_temp)
         await self.send_packet(make_packet)
+
+
+CLIMATE_ENTITIES: Final[dict[type[KocomPacket], type[KocomEntity]]] = {
+    ThermostatPacket: KocomThermostatEntity,
+    ACPacket: KocomACEntity,
+}
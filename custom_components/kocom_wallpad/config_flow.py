@@ -13,7 +13,7 @@ from homeassistant.config_entries import (
 import homeassistant.helpers.config_validation as cv
 
 from .connection import test_connection
-from .const import DOMAIN, LOGGER, DEFAULT_PORT
+from .const import DOMAIN, DEFAULT_PORT
 
 
 class ConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -1,34 +1,92 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Optional
 
 import asyncio
-import re
+import ipaddress
+import random
+import socket
 import serial_asyncio
 
+from .pywallpad.const import TAILER
 from .const import LOGGER
 
 
 class RS485Connection:
     """Connection class for RS485 communication with IP or serial support."""
 
+    __slots__ = (
+        "host",
+        "port",
+        "_is_ip",
+        "reader",
+        "writer",
+        "is_connected",
+        "reconnect_interval",
+        "max_reconnect_interval",
+        "_prev_sleep",
+        "_random",
+        "_connect_lock",
+        "_disconnect_event",
+        "_running",
+        "connection_callbacks",
+    )
+
     def __init__(self, host: str, port: Optional[int] = None):
         """Initialize the connection."""
         self.host = host
         self.port = port
+        self._is_ip = self._check_ip_address(host)
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
         self.is_connected = False
         self.reconnect_interval = 5
+        self.max_reconnect_interval = 60
+        self._prev_sleep = self.reconnect_interval
+        self._random = random.Random()
+        self._connect_lock = asyncio.Lock()
+        self._disconnect_event = asyncio.Event()
+        self._disconnect_event.set()
         self._running = True
+        self.connection_callbacks: list[Callable[[bool], None]] = []
+
+    def add_connection_callback(self, callback: Callable[[bool], None]) -> None:
+        """Add callback for connection state changes."""
+        self.connection_callbacks.append(callback)
+
+    def _set_connected(self, connected: bool) -> None:
+        """Update the connection state and notify callbacks on a change."""
+        if self.is_connected == connected:
+            return
+        self.is_connected = connected
+        for callback in self.connection_callbacks:
+            try:
+                callback(connected)
+            except Exception as e:
+                LOGGER.error("Error in connection callback: %s", e, exc_info=True)
 
     def is_ip_address(self) -> bool:
         """Check if the host is an IP address."""
-        ip_pattern = re.compile(r"^\d{1,3}(\.\d{1,3}){3}$")
-        return bool(ip_pattern.match(self.host))
+        return self._is_ip
+
+    @staticmethod
+    def _check_ip_address(host: str) -> bool:
+        """Return True if the host parses as an IP address."""
+        try:
+            ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return True
 
     async def connect(self) -> bool:
         """Connect to the device using IP or serial."""
+        async with self._connect_lock:
+            if self.is_connected:
+                return True
+            return await self._connect()
+
+    async def _connect(self) -> bool:
+        """Open the IP or serial connection."""
         try:
             if self.is_ip_address():
                 if not self.port:
@@ -36,20 +94,33 @@ class RS485Connection:
                 self.reader, self.writer = await asyncio.open_connection(
                     self.host, self.port
                 )
-                LOGGER.info(f"Connected to {self.host}:{self.port}")
+                self._configure_socket(self.writer.get_extra_info("socket"))
+                LOGGER.info("Connected to %s:%s", self.host, self.port)
             else:
                 self.reader, self.writer = await serial_asyncio.open_serial_connection(
                     url=self.host, baudrate=9600
                 )
-                LOGGER.info(f"Connected to serial port {self.host}")
+                LOGGER.info("Connected to serial port %s", self.host)
             
-            self.is_connected = True
+            self._set_connected(True)
+            self._disconnect_event.clear()
             return True
         except Exception as e:
-            LOGGER.error(f"Connection failed: {e}")
-            self.is_connected = False
+            LOGGER.error("Connection failed: %s", e)
+            self._set_disconnected()
             return False
 
+    @staticmethod
+    def _configure_socket(sock: Optional[socket.socket]) -> None:
+        """Disable Nagle and enlarge the receive buffer for short bursty frames."""
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        except OSError as e:
+            LOGGER.debug("Failed to set socket options: %s", e)
+
     async def disconnect(self):
         """Disconnect from the device."""
         self._running = False
@@ -58,19 +129,34 @@ class RS485Connection:
                 self.writer.close()
                 await self.writer.wait_closed()
             except Exception as e:
-                LOGGER.error(f"Disconnect error: {e}")
-        self.is_connected = False
+                LOGGER.error("Disconnect error: %s", e)
+        self._set_disconnected()
+
+    def next_reconnect_delay(self) -> float:
+        """Return the next reconnect delay using decorrelated jitter."""
+        self._prev_sleep = min(
+            self.max_reconnect_interval,
+            self._random.uniform(self.reconnect_interval, self._prev_sleep * 3),
+        )
+        return self._prev_sleep
+
+    def _set_disconnected(self) -> None:
+        """Mark the connection as lost and wake the reconnect manager."""
+        self._set_connected(False)
+        self._disconnect_event.set()
 
     async def reconnect_manager(self):
         """Reconnect to the device."""
         while self._running:
-            if not self.is_connected:
-                success = await self.connect()
-                if not success:
-                    await asyncio.sleep(self.reconnect_interval)
-            await asyncio.sleep(1)
+            await self._disconnect_event.wait()
+            if not self._running:
+                break
+            if await self.connect():
+                self._prev_sleep = self.reconnect_interval
+            else:
+                await asyncio.sleep(self.next_reconnect_delay())
 
-    async def send(self, packet: bytearray) -> bool:
+    async def send(self, packet: bytes | bytearray) -> bool:
         """Send packet to the device."""
         if not self.is_connected or not self.writer:
             return False
@@ -80,11 +166,11 @@ class RS485Connection:
             return True
         except ConnectionResetError:
             LOGGER.error("Connection reset by peer")
-            self.is_connected = False
+            self._set_disconnected()
             return False
         except Exception as e:
-            LOGGER.error(f"Send error: {e}")
-            self.is_connected = False
+            LOGGER.error("Send error: %s", e)
+            self._set_disconnected()
             return False
 
     async def receive(self) -> Optional[bytes]:
@@ -93,19 +179,25 @@ class RS485Connection:
             return None
 
         try:
-            data = await self.reader.read(512)
+            try:
+                data = await self.reader.readuntil(TAILER)
+            except asyncio.IncompleteReadError as e:
+                data = e.partial
+            except asyncio.LimitOverrunError:
+                data = await self.reader.read(512)
             if not data:
                 LOGGER.warning("Connection closed by peer")
-                self.is_connected = False
+                self._set_disconnected()
                 return None
             return data
-        except ConnectionResetError:
-            LOGGER.error("Connection reset while receiving")
-            self.is_connected = False
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            # Expected while the link flaps; the reconnect manager takes over.
+            LOGGER.error("Connection lost while receiving: %s", e)
+            self._set_disconnected()
             return None
         except Exception as e:
-            LOGGER.error(f"Receive error: {e}")
-            self.is_connected = False
+            LOGGER.error("Receive error: %s", e, exc_info=True)
+            self._set_disconnected()
             return None
 
 
@@ -113,7 +205,8 @@ async def test_connection(host: str, port: Optional[int] = None, timeout: int =
     """Test the connection with a timeout."""
     connection = RS485Connection(host, port)
     try:
-        await asyncio.wait_for(connection.connect(), timeout=timeout)
+        async with asyncio.timeout(timeout):
+            await connection.connect()
         
         if connection.is_connected:
             LOGGER.info("Connection test successful.")
@@ -125,7 +218,7 @@ async def test_connection(host: str, port: Optional[int] = None, timeout: int =
         LOGGER.error("Connection test timed out.")
         return False
     except Exception as e:
-        LOGGER.error(f"Connection test failed with error: {e}")
+        LOGGER.error("Connection test failed with error: %s", e)
         return False
     finally:
         await connection.disconnect()
\ No newline at end of file
@@ -7,12 +7,25 @@ from .pywallpad.packet import (
     ThermostatPacket,
     VentPacket,
     IAQPacket,
-    GasPacket,
     MotionPacket,
     EVPacket,
     DoorPhonePacket,
 )
 
+from .pywallpad.const import (
+    ERROR,
+    HOTWATER,
+    HEATWATER,
+    CO2,
+    TEMPERATURE,
+    DIRECTION,
+    FLOOR,
+    RING,
+)
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from homeassistant.const import Platform
 import logging
 
@@ -30,21 +43,34 @@ DEVICE_TYPE = "device_type"
 ROOM_ID = "room_id"
 SUB_ID = "sub_id"
 
+ADD_ENTITIES_DELAY = 0.1
+
 PACKET_DATA = "packet_data"
 LAST_DATA = "last_data"
 
-PLATFORM_MAPPING: dict[type[KocomPacket], Platform] = {
+PLATFORM_MAPPING: Mapping[type[KocomPacket], Platform] = MappingProxyType({
     ThermostatPacket: Platform.CLIMATE,
     VentPacket: Platform.FAN,
     IAQPacket: Platform.SENSOR,
     MotionPacket: Platform.BINARY_SENSOR,
     EVPacket: Platform.SWITCH,
     DoorPhonePacket: Platform.SWITCH,
-}
+})
 
-PLATFORM_PACKET_TYPE: tuple[type[KocomPacket], ...] = (
+PLATFORM_PACKET_TYPE: frozenset[type[KocomPacket]] = frozenset({
     ThermostatPacket,
     VentPacket,
     EVPacket,
     DoorPhonePacket,
-)
+})
+
+SUB_ID_PLATFORM: Mapping[str, Platform] = MappingProxyType({
+    ERROR: Platform.BINARY_SENSOR,
+    HOTWATER: Platform.SWITCH,
+    CO2: Platform.SENSOR,
+    f"{HOTWATER} {TEMPERATURE}": Platform.SENSOR,
+    f"{HEATWATER} {TEMPERATURE}": Platform.SENSOR,
+    DIRECTION: Platform.SENSOR,
+    FLOOR: Platform.SENSOR,
+    RING: Platform.BINARY_SENSOR,
+})
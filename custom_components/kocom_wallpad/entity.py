@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity, RestoredExtraData
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .pywallpad.packet import KocomPacket
+from .pywallpad.packet import KocomPacket, Device
 
 from .gateway import KocomGateway
 from .util import process_string, create_dev_id, encode_bytes_to_base64
 from .const import (
     DOMAIN,
-    LOGGER,
     BRAND_NAME,
     MANUFACTURER,
     MODEL,
@@ -40,15 +41,21 @@ class KocomEntity(RestoreEntity):
         """Initialize the Kocom Wallpad entity."""
         self.gateway = gateway
         self.packet = packet
-        self.packet_update_signal = f"{DOMAIN}_{self.gateway.host}_{self.device_id}"
+        self.device: Device = packet._device
+        self._device_state = self.device.state
+        self._device_id = create_dev_id(
+            self.device.device_type, self.device.room_id, self.device.sub_id
+        )
+        self._device_name = process_string(self._device_id.replace("_", " "))
         
+        self._attr_available = self.gateway.connection.is_connected
         self._attr_unique_id = f"{BRAND_NAME}_{self.device_id}_{self.gateway.host}"
         self._attr_name = f"{BRAND_NAME} {self.device_name}"
-        self._attr_extra_state_attributes = {
+        self._attr_extra_state_attributes = MappingProxyType({
             DEVICE_TYPE: self.packet._device.device_type,
             ROOM_ID: self.packet._device.room_id,
             SUB_ID: self.packet._device.sub_id,
-        }
+        })
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{self.packet._device.device_type}_{self.gateway.host}")},
             manufacturer=MANUFACTURER,
@@ -61,38 +68,55 @@ class KocomEntity(RestoreEntity):
     @property
     def device_id(self) -> str:
         """Return the device id."""
-        return create_dev_id(
-            self.packet._device.device_type,
-            self.packet._device.room_id,
-            self.packet._device.sub_id
-        )
+        return self._device_id
     
     @property
     def device_name(self) -> str:
         """Return the device name."""
-        return process_string(self.device_id.replace("_", " "))
-    
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.gateway.connection.is_connected
+        return self._device_name
     
+    def _update_attrs(self) -> None:
+        """Update the cached entity attributes from the device state."""
+
+    def _apply_packet(self, packet: KocomPacket) -> None:
+        """Take over the device state carried by the packet."""
+        self.packet = packet
+        self.device = packet._device
+        self._device_state = self.device.state
+        self._update_attrs()
+
     @callback
     def async_handle_packet_update(self, packet: KocomPacket) -> None:
         """Handle packet update."""
-        if self.packet._device.state != packet._device.state:
-            self.packet = packet
+        self._apply_packet(packet)
+        self.async_write_ha_state()
+
+    @callback
+    def async_handle_availability(self, available: bool) -> None:
+        """Handle connection availability change."""
+        if self._attr_available != available:
+            self._attr_available = available
             self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
+        self._attr_available = self.gateway.connection.is_connected
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                self.packet_update_signal,
-                self.async_handle_packet_update
+                self.gateway.available_signal,
+                self.async_handle_availability
+            )
+        )
+        self.async_on_remove(
+            self.gateway.register_update_callback(
+                self._device_id, self.async_handle_packet_update
             )
         )
+        # Catch up on state changes that arrived before the callback existed.
+        packet = self.gateway.get_packet(self._device_id)
+        if packet is not None and packet is not self.packet:
+            self._apply_packet(packet)
         await super().async_added_to_hass()
     
     @property
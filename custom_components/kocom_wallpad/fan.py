@@ -2,26 +2,37 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from collections.abc import Iterable
+from bisect import bisect_left
+from typing import Any, Final, Optional
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, HassJob, HassJobType, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.util.percentage import (
-    ordered_list_item_to_percentage,
-    percentage_to_ordered_list_item,
-)
 
 from .pywallpad.const import POWER, VENT_MODE, FAN_SPEED
 from .pywallpad.packet import KocomPacket, VentPacket
 
 from .gateway import KocomGateway
 from .entity import KocomEntity
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN
+
+FAN_SPEED_TO_PERCENTAGE: Final[dict[VentPacket.FanSpeed, int]] = {
+    VentPacket.FanSpeed.UNKNOWN: 0,
+    VentPacket.FanSpeed.LOW: 33,
+    VentPacket.FanSpeed.MEDIUM: 66,
+    VentPacket.FanSpeed.HIGH: 100,
+}
+# Upper percentage bound of each speed step, in step order.
+PERCENTAGE_STEPS: Final[tuple[int, ...]] = (33, 66, 100)
+PERCENTAGE_FAN_SPEEDS: Final[tuple[VentPacket.FanSpeed, ...]] = (
+    VentPacket.FanSpeed.LOW,
+    VentPacket.FanSpeed.MEDIUM,
+    VentPacket.FanSpeed.HIGH,
+)
 
 
 async def async_setup_entry(
@@ -33,16 +44,21 @@ async def async_setup_entry(
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
     @callback
-    def async_add_fan(packet: KocomPacket) -> None:
-        """Add new fan entity."""
-        if isinstance(packet, VentPacket):
-            async_add_entities([KocomFanEntity(gateway, packet)])
-    
-    for entity in gateway.get_entities(Platform.FAN):
-        async_add_fan(entity)
-        
+    def async_add_fan(packets: Iterable[KocomPacket]) -> None:
+        """Add new fan entities."""
+        async_add_entities([
+            KocomFanEntity(gateway, packet)
+            for packet in packets
+            if type(packet) is VentPacket
+        ])
+
+    async_add_fan(gateway.get_entities(Platform.FAN))
+
     entry.async_on_unload(
-        async_dispatcher_connect(hass, f"{DOMAIN}_fan_add", async_add_fan)
+        gateway.register_platform(
+            Platform.FAN,
+            HassJob(async_add_fan, "kocom add fan", job_type=HassJobType.Callback),
+        )
     )
 
 
@@ -63,11 +79,6 @@ class KocomFanEntity(KocomEntity, FanEntity):
         VentPacket.VentMode.NIGHT.name,
         VentPacket.VentMode.AIR_PURIFIER.name,
     ]
-    _attr_speed_list = [
-        VentPacket.FanSpeed.LOW.value,
-        VentPacket.FanSpeed.MEDIUM.value,
-        VentPacket.FanSpeed.HIGH.value,
-    ]
 
     def __init__(
         self,
@@ -76,31 +87,22 @@ class KocomFanEntity(KocomEntity, FanEntity):
     ) -> None:
         """Initialize the fan."""
         super().__init__(gateway, packet)
+        self._update_attrs()
+
+    def _update_attrs(self) -> None:
+        """Update the cached fan attributes from the device state."""
+        self._attr_percentage = FAN_SPEED_TO_PERCENTAGE[self._device_state[FAN_SPEED]]
+        self._attr_preset_mode = self._device_state[VENT_MODE].name
 
     @property
     def is_on(self) -> bool:
         """Return the state of the fan."""
-        return self.packet._device.state[POWER]
-
-    @property
-    def percentage(self) -> int:
-        """Return the current speed percentage."""
-        fan_speed = self.packet._device.state[FAN_SPEED]
-        if fan_speed == VentPacket.FanSpeed.UNKNOWN:
-            return 0
-        return ordered_list_item_to_percentage(self._attr_speed_list, fan_speed.value)
-    
-    @property
-    def preset_mode(self) -> str:
-        """Return the current preset mode."""
-        vent_mode = self.packet._device.state[VENT_MODE]
-        return vent_mode.name
+        return self._device_state[POWER]
     
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed percentage of the fan."""
         if percentage > 0:
-            speed_item = percentage_to_ordered_list_item(self._attr_speed_list, percentage)
-            fan_speed = VentPacket.FanSpeed(speed_item)
+            fan_speed = PERCENTAGE_FAN_SPEEDS[bisect_left(PERCENTAGE_STEPS, percentage)]
         else:
             fan_speed = VentPacket.FanSpeed.UNKNOWN
 
@@ -2,22 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import ValuesView
+from typing import Callable
+
 from homeassistant.const import Platform, CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant, Event
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, Event, HassJob, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers import entity_registry as er, restore_state
 
 from .pywallpad.client import KocomClient, verify_crc
-from .pywallpad.const import (
-    ERROR,
-    HOTWATER,
-    CO2,
-    TEMPERATURE,
-    DIRECTION,
-    FLOOR,
-    RING,
-)
 from .pywallpad.packet import (
     KocomPacket,
     PacketParser,
@@ -33,6 +28,8 @@ from .const import (
     LAST_DATA, 
     PLATFORM_MAPPING,
     PLATFORM_PACKET_TYPE,
+    SUB_ID_PLATFORM,
+    ADD_ENTITIES_DELAY,
 )
 
 
@@ -47,8 +44,18 @@ class KocomGateway:
         self.port = entry.data.get(CONF_PORT)
 
         self.connection = RS485Connection(self.host, self.port)
+        self.connection.add_connection_callback(self._handle_connection_change)
+        self.available_signal = f"{DOMAIN}_{self.host}_available"
         self.client: KocomClient = KocomClient(self.connection)
         self.entities: dict[Platform, dict[str, KocomPacket]] = {}
+        self.platform_jobs: dict[Platform, HassJob] = {}
+        self.update_callbacks: dict[str, list[Callable[[KocomPacket], None]]] = {}
+        self.last_states: dict[str, dict] = {}
+        self.dev_platforms: dict[str, Platform] = {}
+        self.dev_ids: dict[tuple[str, str | None, str | None], str] = {}
+        self.unsupported_types: set[type] = set()
+        self.pending_packets: dict[Platform, dict[str, KocomPacket]] = {}
+        self.flush_handle: asyncio.TimerHandle | None = None
     
     async def async_connect(self) -> bool:
         """Connect to the gateway."""
@@ -56,14 +63,22 @@ class KocomGateway:
             await self.connection.connect()
             return self.connection.is_connected
         except Exception as e:
-            LOGGER.error(f"Failed to connect to the gateway: {e}")
+            LOGGER.error("Failed to connect to the gateway: %s", e)
             return False
     
     async def async_disconnect(self) -> None:
         """Disconnect from the gateway."""
         if self.client:
             await self.client.stop()
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
         self.entities.clear()
+        self.platform_jobs.clear()
+        self.update_callbacks.clear()
+        self.last_states.clear()
+        self.dev_platforms.clear()
+        self.pending_packets.clear()
         await self.connection.disconnect()
 
     async def async_start(self) -> None:
@@ -75,9 +90,50 @@ class KocomGateway:
         """Close the gateway."""
         await self.async_disconnect()
     
-    def get_entities(self, platform: Platform) -> list[KocomPacket]:
+    @callback
+    def _handle_connection_change(self, connected: bool) -> None:
+        """Push connection state changes to the entities."""
+        async_dispatcher_send(self.hass, self.available_signal, connected)
+
+    def register_platform(self, platform: Platform, job: HassJob) -> CALLBACK_TYPE:
+        """Register the job that adds new entities for the platform."""
+        self.platform_jobs[platform] = job
+
+        @callback
+        def unregister_platform() -> None:
+            """Unregister the job that adds new entities for the platform."""
+            if self.platform_jobs.get(platform) is job:
+                del self.platform_jobs[platform]
+
+        return unregister_platform
+
+    def register_update_callback(
+        self, dev_id: str, update_callback: Callable[[KocomPacket], None]
+    ) -> CALLBACK_TYPE:
+        """Register a callback for packet updates of the device."""
+        self.update_callbacks.setdefault(dev_id, []).append(update_callback)
+
+        @callback
+        def unregister_update_callback() -> None:
+            """Unregister the callback for packet updates of the device."""
+            if (callbacks := self.update_callbacks.get(dev_id)) is None:
+                return
+            if update_callback in callbacks:
+                callbacks.remove(update_callback)
+            if not callbacks:
+                del self.update_callbacks[dev_id]
+
+        return unregister_update_callback
+
+    def get_entities(self, platform: Platform) -> ValuesView[KocomPacket]:
         """Get the entities for the platform."""
-        return list(self.entities.get(platform, {}).values())
+        return self.entities.get(platform, {}).values()
+
+    def get_packet(self, dev_id: str) -> KocomPacket | None:
+        """Get the latest packet for the device."""
+        if (platform := self.dev_platforms.get(dev_id)) is None:
+            return None
+        return self.entities[platform].get(dev_id)
 
     async def _async_fetch_last_packets(self, entity_id: str) -> list[KocomPacket]:
         """Fetch the last packets for the entity."""
@@ -93,7 +149,7 @@ class KocomGateway:
         
         packet = decode_base64_to_bytes(packet_data)
         last_data = state.extra_data.as_dict().get(LAST_DATA)
-        LOGGER.debug(f"Last data: {last_data}")
+        LOGGER.debug("Last data: %s", last_data)
         
         if verify_crc(packet):
             return DoorPhoneParser.parse_state(packet, last_data)
@@ -108,49 +164,65 @@ class KocomGateway:
         for entity in entities:
             packets = await self._async_fetch_last_packets(entity.entity_id)
             for packet in packets:
-                await self._handle_device_update(packet)
+                self._handle_device_update(packet)
     
-    async def _handle_device_update(self, packet: KocomPacket) -> None:
+    @callback
+    def _handle_device_update(self, packet: KocomPacket) -> None:
         """Handle device update."""
-        platform = self.parse_platform(packet)
-        if platform is None:
-            LOGGER.error(f"Failed to parse platform from packet: {packet}")
-            return
-        
-        if platform not in self.entities:
-            self.entities[platform] = {}
-        
         device = packet._device
-        dev_id = create_dev_id(device.device_type, device.room_id, device.sub_id)
+        key = (device.device_type, device.room_id, device.sub_id)
+        if (dev_id := self.dev_ids.get(key)) is None:
+            dev_id = self.dev_ids[key] = create_dev_id(*key)
 
-        packet_update_signal = f"{DOMAIN}_{self.host}_{dev_id}"
-        async_dispatcher_send(self.hass, packet_update_signal, packet)
-        
-        if dev_id not in self.entities[platform]:
-            self.entities[platform][dev_id] = packet
+        # Known devices skip platform parsing; their platform never changes.
+        platform = self.dev_platforms.get(dev_id)
+        if (known := platform is not None):
+            if self.last_states[dev_id] == device.state:
+                return
+        elif (platform := self.parse_platform(packet)) is None:
+            LOGGER.debug("Failed to parse platform from packet: %s", packet)
+            return
+        else:
+            self.dev_platforms[dev_id] = platform
+        self.last_states[dev_id] = device.state
+
+        # Keep the newest packet so entities that are not subscribed yet, or
+        # still waiting in the discovery window, are created from it.
+        self.entities.setdefault(platform, {})[dev_id] = packet
+        if (pending := self.pending_packets.get(platform)) and dev_id in pending:
+            pending[dev_id] = packet
+
+        for update_callback in self.update_callbacks.get(dev_id, ()):
+            update_callback(packet)
 
-            add_signal = f"{DOMAIN}_{platform.value}_add"
-            async_dispatcher_send(self.hass, add_signal, packet)
+        if not known and platform in self.platform_jobs:
+            self.pending_packets.setdefault(platform, {})[dev_id] = packet
+            # Fixed window from the first pending device, so a steady stream of
+            # discoveries can't keep pushing the flush back.
+            if self.flush_handle is None:
+                self.flush_handle = self.hass.loop.call_later(
+                    ADD_ENTITIES_DELAY, self._flush_pending_packets
+                )
+
+    @callback
+    def _flush_pending_packets(self) -> None:
+        """Hand the packets discovered in the last window to their platforms."""
+        self.flush_handle = None
+        pending_packets, self.pending_packets = self.pending_packets, {}
+        for platform, packets in pending_packets.items():
+            if (job := self.platform_jobs.get(platform)) is not None:
+                self.hass.async_run_hass_job(job, packets.values())
         
     def parse_platform(self, packet: KocomPacket) -> Platform | None:
         """Parse the platform from the packet."""
         platform = PLATFORM_MAPPING.get(type(packet))
         if platform is None:
-            LOGGER.warning(f"Unrecognized platform type: {type(packet).__name__}")
+            if (packet_type := type(packet)) not in self.unsupported_types:
+                self.unsupported_types.add(packet_type)
+                LOGGER.warning("Unrecognized platform type: %s", packet_type.__name__)
             return None
         
-        if (isinstance(packet, PLATFORM_PACKET_TYPE) and (sub_id := packet._device.sub_id)):
-            if ERROR in sub_id:
-                platform = Platform.BINARY_SENSOR
-            elif HOTWATER == sub_id:
-                platform = Platform.SWITCH
-            elif CO2 in sub_id:
-                platform = Platform.SENSOR
-            elif TEMPERATURE in sub_id:
-                platform = Platform.SENSOR
-            elif sub_id in {DIRECTION, FLOOR}:
-                platform = Platform.SENSOR
-            elif sub_id in RING:
-                platform = Platform.BINARY_SENSOR
-                
+        if (type(packet) in PLATFORM_PACKET_TYPE and (sub_id := packet._device.sub_id)):
+            platform = SUB_ID_PLATFORM.get(sub_id, platform)
+
         return platform
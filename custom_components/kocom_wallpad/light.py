@@ -2,22 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, Final
 
 from homeassistant.components.light import LightEntity, ColorMode, ATTR_BRIGHTNESS
 
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, HassJob, HassJobType, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .pywallpad.const import POWER, BRIGHTNESS, LEVEL
 from .pywallpad.packet import KocomPacket, LightPacket
 
 from .gateway import KocomGateway
 from .entity import KocomEntity
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN
+
+# Home Assistant brightness (0..255) to the wallpad brightness level.
+BRIGHTNESS_TO_LEVEL: Final[bytes] = bytes(((i * 3) // 225) + 1 for i in range(256))
 
 
 async def async_setup_entry(
@@ -29,16 +32,21 @@ async def async_setup_entry(
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
     @callback
-    def async_add_light(packet: KocomPacket) -> None:
-        """Add new light entity."""
-        if isinstance(packet, LightPacket):
-            async_add_entities([KocomLightEntity(gateway, packet)])
-
-    for entity in gateway.get_entities(Platform.LIGHT):
-        async_add_light(entity)
-        
+    def async_add_light(packets: Iterable[KocomPacket]) -> None:
+        """Add new light entities."""
+        async_add_entities([
+            KocomLightEntity(gateway, packet)
+            for packet in packets
+            if type(packet) is LightPacket
+        ])
+
+    async_add_light(gateway.get_entities(Platform.LIGHT))
+
     entry.async_on_unload(
-        async_dispatcher_connect(hass, f"{DOMAIN}_light_add", async_add_light)
+        gateway.register_platform(
+            Platform.LIGHT,
+            HassJob(async_add_light, "kocom add light", job_type=HassJobType.Callback),
+        )
     )
 
 
@@ -55,10 +63,23 @@ class KocomLightEntity(KocomEntity, LightEntity):
     ) -> None:
         """Initialize the light."""
         super().__init__(gateway, packet)
+        self._update_attrs()
 
-        if self.is_brightness:
+    def _update_attrs(self) -> None:
+        """Update the cached light attributes from the device state."""
+        # Brightness levels are discovered at runtime, so upgrade the mode late.
+        bri_lv = self.packet._last_data[self.packet.device_id]["bri_lv"]
+        if self._attr_color_mode is not ColorMode.BRIGHTNESS and bri_lv:
             self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
             self._attr_color_mode = ColorMode.BRIGHTNESS
+
+        state = self._device_state
+        self._attr_is_on = state[POWER]
+        brightness = state.get(BRIGHTNESS, 0)
+        if brightness not in state.get(LEVEL, []):
+            self._attr_brightness = 255
+        else:
+            self._attr_brightness = ((225 // (len(bri_lv) + 1)) * brightness) + 1
     
     @property
     def is_brightness(self) -> bool:
@@ -70,31 +91,11 @@ class KocomLightEntity(KocomEntity, LightEntity):
         """Return the maximum supported brightness."""
         return len(self.packet._last_data[self.packet.device_id]["bri_lv"]) + 1
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if light is on."""
-        if self.is_brightness:
-            self._attr_supported_color_modes = {ColorMode.BRIGHTNESS}
-            self._attr_color_mode = ColorMode.BRIGHTNESS
-
-        return self.packet._device.state[POWER]
-    
-    @property
-    def brightness(self) -> int:
-        """Return the brightness of this light between 0..255."""
-        brightness = self.packet._device.state.get(BRIGHTNESS, 0)
-        level = self.packet._device.state.get(LEVEL, [])
-
-        if brightness not in level:
-            return 255
-        return ((225 // self.max_brightness) * brightness) + 1
-    
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on light."""
         if self.is_brightness:
-            brightness = int(kwargs.get(ATTR_BRIGHTNESS, 255))
-            brightness = ((brightness * 3) // 225) + 1
-            brightness_level =  self.packet._device.state.get(LEVEL, [])
+            brightness = BRIGHTNESS_TO_LEVEL[int(kwargs.get(ATTR_BRIGHTNESS, 255))]
+            brightness_level = self._device_state.get(LEVEL, [])
             if brightness not in brightness_level:
                 brightness = 255
             make_packet = self.packet.make_brightness_status(brightness)
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-import time
-from typing import Callable, Awaitable
+import re
+from typing import Callable
 from dataclasses import dataclass
 
 from ..connection import RS485Connection
@@ -17,14 +17,31 @@ from .packet import (
     PacketParser,
     DoorPhoneParser,
 )
-from .const import _LOGGER, HEADER, TAILER
+from .const import _LOGGER, HEADER, TAILER, DOOR_PHONE_PREFIX
 
+PACKET_PATTERN = re.compile(re.escape(HEADER) + rb".{17}" + re.escape(TAILER), re.DOTALL)
 
-@dataclass
+
+class LazyHex:
+    """Format bytes as hex only when the log record is emitted."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize the wrapper."""
+        self.data = data
+
+    def __str__(self) -> str:
+        """Return the hex representation."""
+        return self.data.hex()
+
+
+@dataclass(slots=True)
 class PacketQueue:
     """A queue of packets to be sent."""
     packet: bytearray
     retries: int = 0
+    ack_packets: list[KocomPacket] | None = None
 
 
 class KocomClient:
@@ -34,12 +51,14 @@ class KocomClient:
         """Initialize the KocomClient."""
         self.connection = connection
         self.max_retries: int = 4
-        self.packets: bytes = bytes()
+        self.packets = bytearray()
 
         self.tasks: list[asyncio.Task] = []
-        self.device_callbacks: list[Callable[[KocomPacket], Awaitable[None]]] = []
+        self.timer_handles: set[asyncio.TimerHandle] = set()
+        self.device_callbacks: list[Callable[[KocomPacket], None]] = []
         self.packet_queue: asyncio.Queue[PacketQueue] = asyncio.Queue()
         self.last_packet: KocomPacket | None = None
+        self.packet_event = asyncio.Event()
 
     async def start(self) -> None:
         """Start the client."""
@@ -54,10 +73,13 @@ class KocomClient:
         for task in self.tasks:
             task.cancel()
         self.tasks.clear()
+        for handle in self.timer_handles:
+            handle.cancel()
+        self.timer_handles.clear()
         self.device_callbacks.clear()
         self.last_packet = None
 
-    def add_device_callback(self, callback: Callable[[KocomPacket], Awaitable[None]]) -> None:
+    def add_device_callback(self, callback: Callable[[KocomPacket], None]) -> None:
         """Add callback for device updates."""
         self.device_callbacks.append(callback)
 
@@ -78,65 +100,84 @@ class KocomClient:
                 for packet in packets:
                     await self._process_packet(packet)
             except ValueError as ve:
-                _LOGGER.error(f"Error processing packet: {ve}", exc_info=True)
+                _LOGGER.error("Error processing packet: %s", ve, exc_info=True)
                 await asyncio.sleep(0.5)
             except Exception as e:
-                _LOGGER.error(f"Error receiving data: {e}", exc_info=True)
+                _LOGGER.error("Error receiving data: %s", e, exc_info=True)
                 await asyncio.sleep(0.5)
 
     def parse_packets(self, data: bytes) -> list[bytes]:
         """Extract 21-byte packets with specific start/end markers."""
-        packets: list[bytes] = []
+        buffer = self.packets
+        buffer += data
 
-        for byte in data:
-            self.packets += bytes([byte])
-            if len(self.packets) < 21:
-                continue
+        # receive() reads up to the tailer, so an in-sync buffer holds exactly
+        # one frame; only fall back to scanning when out of sync.
+        if len(buffer) == 21 and buffer[:2] == HEADER and buffer[19:] == TAILER:
+            packet = bytes(buffer)
+            buffer.clear()
+            return [packet]
+
+        offset = 0
+        packets: list[bytes] = []
+        for match in PACKET_PATTERN.finditer(buffer):
+            packets.append(bytes(match[0]))
+            offset = match.end()
 
-            if self.packets[:2] == HEADER and self.packets[-2:] == TAILER:
-                packets.append(self.packets)
-                self.packets = bytes()
-            elif len(self.packets) > 21:
-                self.packets = self.packets[1:]
+        # Keep a header whose frame is still incomplete, or a trailing byte
+        # that may be the first half of the next header.
+        tail = max(offset, len(buffer) - 20)
+        if (start := buffer.find(HEADER, tail)) == -1:
+            start = max(offset, len(buffer) - 1)
 
+        del buffer[:start]
         return packets
 
     async def _process_packet(self, packet: bytes) -> None:
         """Process a single packet."""
         parser, log_message = None, None
 
-        if verify_checksum(packet):
+        # Door phone frames are CRC protected, everything else uses the sum
+        # checksum; probe the likely one first and keep the other as fallback.
+        if packet[2] == DOOR_PHONE_PREFIX:
+            if verify_crc(packet):
+                parser, log_message = DoorPhoneParser, "Received door phone"
+            elif verify_checksum(packet):
+                parser, log_message = PacketParser, "Received packet"
+        elif verify_checksum(packet):
             parser, log_message = PacketParser, "Received packet"
         elif verify_crc(packet):
             parser, log_message = DoorPhoneParser, "Received door phone"
-        else:
-            _LOGGER.debug(f"Invalid packet received: {packet.hex()}")
-            return
 
-        if parser:
-            parsed_packets = parser.parse_state(packet)
-            for parsed_packet in parsed_packets:
-                _LOGGER.debug(
-                    f"{log_message}: {parsed_packet}, {parsed_packet._device}, {parsed_packet._last_data}"
-                )
-                if isinstance(parsed_packet, KocomPacket):
-                    self.last_packet = parsed_packet
+        if parser is None:
+            _LOGGER.debug("Invalid packet received: %s", LazyHex(packet))
+            return
 
-                if parsed_packet._device is None:
-                    continue
+        parsed_packets = parser.parse_state(packet)
+        for parsed_packet in parsed_packets:
+            _LOGGER.debug(
+                "%s: %s, %s, %s",
+                log_message, parsed_packet, parsed_packet._device, parsed_packet._last_data
+            )
+            if isinstance(parsed_packet, KocomPacket):
+                self.last_packet = parsed_packet
+                self.packet_event.set()
+
+            if parsed_packet._device is None:
+                continue
 
-                for callback in self.device_callbacks:
-                    try:
-                        await callback(parsed_packet)
-                    except Exception as e:
-                        _LOGGER.error(f"Error in callback: {e}", exc_info=True)
+            for callback in self.device_callbacks:
+                try:
+                    callback(parsed_packet)
+                except Exception as e:
+                    _LOGGER.error("Error in callback: %s", e, exc_info=True)
 
     async def _process_queue(self) -> None:
         """Process packets in the queue."""
         while True:
             try:
                 queue = await self.packet_queue.get()
-                _LOGGER.debug(f"Sending packet: {queue.packet.hex()}")
+                _LOGGER.debug("Sending packet: %s", LazyHex(queue.packet))
                 await self.connection.send(queue.packet)
 
                 if verify_crc(queue.packet) or (
@@ -146,85 +187,110 @@ class KocomClient:
                     continue
 
                 try:
-                    packet = PacketParser.parse_state(queue.packet)
+                    # The expected ACKs don't change between retries; parse once.
+                    if queue.ack_packets is None:
+                        queue.ack_packets = PacketParser.parse_state(queue.packet)
                     found_match = False
-                    start_time = time.time()
-
-                    while (time.time() - start_time) < 0.5:
-                        if self.last_packet is None:
-                            await asyncio.sleep(0.01)
-                            continue
-
-                        for p in packet:
-                            if self.last_packet._device == p._device:
-                                found_match = True
-                                self.last_packet = None
-                                break
-
-                        if found_match:
-                            break
-                        await asyncio.sleep(0.01)
+                    try:
+                        async with asyncio.timeout(0.5):
+                            while not (found_match := self._match_ack(queue.ack_packets)):
+                                self.packet_event.clear()
+                                await self.packet_event.wait()
+                    except asyncio.TimeoutError:
+                        pass
 
                     if not found_match:
                         _LOGGER.debug("Not received ACK, retrying...")
-                        await self._handle_retry(queue)
+                        self._handle_retry(queue)
                     else:
-                        _LOGGER.debug(f"Command success: {queue.packet.hex()}")
+                        _LOGGER.debug("Command success: %s", LazyHex(queue.packet))
                         self.packet_queue.task_done()
 
                 except Exception as e:
-                    _LOGGER.error(f"Error processing response: {e}", exc_info=True)
-                    await self._handle_retry(queue)
+                    _LOGGER.error("Error processing response: %s", e, exc_info=True)
+                    self._handle_retry(queue)
 
             except Exception as e:
-                _LOGGER.error(f"Error processing queue: {e}", exc_info=True)
+                _LOGGER.error("Error processing queue: %s", e, exc_info=True)
                 await asyncio.sleep(0.5)
 
-    async def _handle_retry(self, queue: PacketQueue) -> None:
+    def _match_ack(self, packets: list[KocomPacket]) -> bool:
+        """Consume the last received packet if it acknowledges the command."""
+        if self.last_packet is None:
+            return False
+
+        for p in packets:
+            if self.last_packet._device == p._device:
+                self.last_packet = None
+                return True
+        return False
+
+    def _handle_retry(self, queue: PacketQueue) -> None:
         """Handle command retry."""
         if queue.retries >= self.max_retries:
-            _LOGGER.error(f"Command failed after {self.max_retries} retries: {queue.packet.hex()}")
+            _LOGGER.error(
+                "Command failed after %s retries: %s", self.max_retries, LazyHex(queue.packet)
+            )
             self.packet_queue.task_done()
             return
 
         queue.retries += 1
-        _LOGGER.debug(f"Retrying command (attempt {queue.retries}): {queue.packet.hex()}")
-        await asyncio.sleep(0.1 * (2 ** queue.retries))
-        await self.packet_queue.put(queue)
+        _LOGGER.debug(
+            "Retrying command (attempt %s): %s", queue.retries, LazyHex(queue.packet)
+        )
+        # Requeue from a timer so the backoff doesn't stall the other commands.
+        self.packet_queue.task_done()
+        self._put_later(0.1 * (2 ** queue.retries), queue)
+
+    def _put_later(self, delay: float, queue: PacketQueue) -> None:
+        """Put a command on the queue after the delay, unless the client stops."""
+        def put() -> None:
+            self.timer_handles.discard(handle)
+            self.packet_queue.put_nowait(queue)
+
+        handle = asyncio.get_running_loop().call_later(delay, put)
+        self.timer_handles.add(handle)
 
     async def send_packet(self, packet: bytearray | list[tuple[bytearray, float | None]]) -> None:
         """Send a packet to the device."""
         if isinstance(packet, list):
+            # Schedule the sequence up front instead of sleeping between steps.
+            send_at = 0.0
             for p, delay in packet:
                 if delay is not None:
-                    await asyncio.sleep(delay)
+                    send_at += delay
 
-                p[:0] = HEADER
-                if (crc := calculate_crc(p)) is None:
-                    _LOGGER.error(f"Failed to calculate checksum for packet: {p.hex()}")
+                frame = bytearray(HEADER)
+                frame += p
+                if (crc := calculate_crc(frame)) is None:
+                    _LOGGER.error("Failed to calculate checksum for packet: %s", LazyHex(frame))
                     continue
 
-                p.extend(crc)
-                p.extend(TAILER)
+                frame.extend(crc)
+                frame.extend(TAILER)
 
-                if not verify_crc(p):
-                    _LOGGER.error(f"Failed to verify checksum for packet: {p.hex()}")
+                if __debug__ and not verify_crc(frame):
+                    _LOGGER.error("Failed to verify checksum for packet: %s", LazyHex(frame))
                     continue
 
-                queue = PacketQueue(packet=p)
-                await self.packet_queue.put(queue)
+                queue = PacketQueue(packet=frame)
+                if send_at:
+                    self._put_later(send_at, queue)
+                else:
+                    self.packet_queue.put_nowait(queue)
         else:
-            packet[:0] = HEADER
-            if (sum := calculate_checksum(packet)) is None:
-                _LOGGER.error(f"Failed to calculate checksum for packet: {packet.hex()}")
+            frame = bytearray(HEADER)
+            frame += packet
+            if (sum := calculate_checksum(frame)) is None:
+                _LOGGER.error("Failed to calculate checksum for packet: %s", LazyHex(frame))
                 return
 
-            packet.append(sum)
-            packet.extend(TAILER)
+            frame.append(sum)
+            frame.extend(TAILER)
 
-            if not verify_checksum(packet):
-                _LOGGER.error(f"Failed to verify checksum for packet: {packet.hex()}")
+            if __debug__ and not verify_checksum(frame):
+                _LOGGER.error("Failed to verify checksum for packet: %s", LazyHex(frame))
                 return
 
-            queue = PacketQueue(packet=packet)
+            queue = PacketQueue(packet=frame)
             await self.packet_queue.put(queue)
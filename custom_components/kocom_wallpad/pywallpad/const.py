@@ -6,6 +6,7 @@ _LOGGER = logging.getLogger(__package__)
 
 HEADER = b"\xAA\x55"  # 0xAA 0x55
 TAILER = b"\x0D\x0D"  # 0x0D 0x0D
+DOOR_PHONE_PREFIX = 0x79  # First byte after the header on door phone frames
 
 POWER = "power"
 BRIGHTNESS = "brightness"
@@ -1,18 +1,47 @@
 """CRC calculation for py wallpad."""
 
-def crc_ccitt_xmodem(data: bytes) -> int:
-    """Calculate CRC-CCITT (XMODEM) checksum."""
-    crc = 0x0000
-    polynomial = 0x1021
+from typing import Final
 
-    for byte in data:
-        crc ^= (byte << 8)
+def _make_xmodem_table(polynomial: int = 0x1021) -> tuple[int, ...]:
+    """Build the byte-wise lookup table for CRC-CCITT (XMODEM)."""
+    table = []
+    for byte in range(256):
+        crc = byte << 8
         for _ in range(8):
             if crc & 0x8000:
                 crc = (crc << 1) ^ polynomial
             else:
                 crc = crc << 1
             crc &= 0xFFFF  # Keep CRC 16-bit
+        table.append(crc)
+    return tuple(table)
+
+def _shift_xmodem_table(table: tuple[int, ...]) -> tuple[int, ...]:
+    """Advance every entry of a lookup table past one more zero byte."""
+    return tuple(((crc << 8) & 0xFFFF) ^ XMODEM_TABLE[crc >> 8] for crc in table)
+
+XMODEM_TABLE: Final[tuple[int, ...]] = _make_xmodem_table()
+# Slice-by-4: CRC of a byte followed by one, two and three zero bytes.
+XMODEM_TABLE_1: Final[tuple[int, ...]] = _shift_xmodem_table(XMODEM_TABLE)
+XMODEM_TABLE_2: Final[tuple[int, ...]] = _shift_xmodem_table(XMODEM_TABLE_1)
+XMODEM_TABLE_3: Final[tuple[int, ...]] = _shift_xmodem_table(XMODEM_TABLE_2)
+
+def crc_ccitt_xmodem(data: bytes) -> int:
+    """Calculate CRC-CCITT (XMODEM) checksum."""
+    crc = 0x0000
+    t0, t1, t2, t3 = XMODEM_TABLE, XMODEM_TABLE_1, XMODEM_TABLE_2, XMODEM_TABLE_3
+
+    # Fold four bytes per step; the 16-bit CRC only reaches the first two.
+    end = len(data) & ~3
+    for i in range(0, end, 4):
+        crc = (
+            t3[(crc >> 8) ^ data[i]]
+            ^ t2[(crc & 0xFF) ^ data[i + 1]]
+            ^ t1[data[i + 2]]
+            ^ t0[data[i + 3]]
+        )
+    for byte in data[end:]:
+        crc = ((crc << 8) & 0xFFFF) ^ t0[(crc >> 8) ^ byte]
     return crc
 
 def verify_crc(packet: bytes) -> bool:
@@ -26,7 +55,7 @@ def verify_crc(packet: bytes) -> bool:
     calculated_checksum = crc_ccitt_xmodem(data)
     return calculated_checksum == provided_checksum
 
-def calculate_crc(packet: bytes) -> list[int, int] | None:
+def calculate_crc(packet: bytes) -> bytes | None:
     """Calculate CRC for a packet."""
     if len(packet) < 17:
         return None
@@ -34,10 +63,8 @@ def calculate_crc(packet: bytes) -> list[int, int] | None:
     data = packet[2:17]  # Data for CRC calculation (bytes 3 to 17, 0-indexed)
     checksum = crc_ccitt_xmodem(data)
 
-    # Append the 16-bit checksum (split into two bytes)
-    checksum_high = (checksum >> 8) & 0xFF
-    checksum_low = checksum & 0xFF
-    return [checksum_high, checksum_low]
+    # Append the 16-bit checksum (big-endian, high byte first)
+    return checksum.to_bytes(2, "big")
 
 def verify_checksum(packet: bytes) -> bool:
     """Verify checksum for a packet."""
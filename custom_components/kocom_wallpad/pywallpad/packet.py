@@ -601,7 +601,7 @@ class GasPacket(KocomPacket):
     def make_power_status(self, power: bool) -> bytearray:
         """Make a power status packet."""
         if power:
-            _LOGGER.debug(f"Gas device is on. Ignoring power status.")
+            _LOGGER.debug("Gas device is on. Ignoring power status.")
             return
         return super().make_packet(Command.OFF, bytearray(self.payload))
     
@@ -623,7 +623,7 @@ class MotionPacket(KocomPacket):
     def parse_data(self) -> list[Device]:
         """Parse motion-specific data."""
         if is_detected := (self.command == Command.DETECT):
-            _LOGGER.debug(f"Motion detected at {datetime.now()}")
+            _LOGGER.debug("Motion detected at %s", datetime.now())
             self._last_data[self.device_id]["detect_time"] = datetime.now()
 
         device = Device(
@@ -708,7 +708,7 @@ class EVPacket(KocomPacket):
     def make_power_status(self, power: bool) -> bytearray:
         """Make a power status packet."""
         if not power:
-            _LOGGER.debug(f"EV device is off. Ignoring power status.")
+            _LOGGER.debug("EV device is off. Ignoring power status.")
             return
         self._force_update.append(
             Device(
@@ -721,6 +721,20 @@ class EVPacket(KocomPacket):
         return super().make_packet(Command.ON, bytearray(self.payload))
 
 
+DEVICE_PACKET_CLASSES: dict[int, type[KocomPacket]] = {
+    DeviceType.LIGHT.value: LightPacket,
+    DeviceType.OUTLET.value: OutletPacket,
+    DeviceType.THERMOSTAT.value: ThermostatPacket,
+    DeviceType.AC.value: ACPacket,
+    DeviceType.VENT.value: VentPacket,
+    DeviceType.IAQ.value: IAQPacket,
+    DeviceType.GAS.value: GasPacket,
+    DeviceType.MOTION.value: MotionPacket,
+    DeviceType.EV.value: EVPacket,
+    DeviceType.WALLPAD.value: KocomPacket,
+}
+
+
 class PacketParser:
     """Parses raw Kocom packets into specific device classes."""
 
@@ -768,22 +782,10 @@ class PacketParser:
     @staticmethod
     def _get_packet_instance(device_type: int, packet_data: bytes) -> KocomPacket:
         """Retrieve the appropriate packet class based on device type."""
-        device_class_map = {
-            DeviceType.LIGHT.value: LightPacket,
-            DeviceType.OUTLET.value: OutletPacket,
-            DeviceType.THERMOSTAT.value: ThermostatPacket,
-            DeviceType.AC.value: ACPacket,
-            DeviceType.VENT.value: VentPacket,
-            DeviceType.IAQ.value: IAQPacket,
-            DeviceType.GAS.value: GasPacket,
-            DeviceType.MOTION.value: MotionPacket,
-            DeviceType.EV.value: EVPacket,
-            DeviceType.WALLPAD.value: KocomPacket,
-        }
-        packet_class = device_class_map.get(device_type)
+        packet_class = DEVICE_PACKET_CLASSES.get(device_type)
 
         if packet_class is None:
-            _LOGGER.warning(f"Unknown device type: {device_type:#x}, packet: {packet_data.hex()}")
+            _LOGGER.warning("Unknown device type: %#x, packet: %s", device_type, packet_data.hex())
             return None
 
         return packet_class(packet_data)
@@ -836,15 +838,15 @@ class DoorPhonePacket:
         devices: list[Device] = []
         
         if is_ringing := (self.event == 0x01 and self.event2 == 0x01):
-            _LOGGER.debug(f"Door phone - {self.room_id} ringing at {datetime.now()}")
+            _LOGGER.debug("Door phone - %s ringing at %s", self.room_id, datetime.now())
             self._last_data[self.device_id]["ringing_time"] = datetime.now()
         
         if self._last_data[self.device_id]["phone_id"] is None and self.src2 not in {0xFF, 0x31}:
             self._last_data[self.device_id]["phone_id"] = self.src2
-            _LOGGER.debug(f"Door phone - {self.room_id} phone id: {self._last_data[self.device_id]['phone_id']:#x}")
+            _LOGGER.debug("Door phone - %s phone id: %#x", self.room_id, self._last_data[self.device_id]['phone_id'])
         
         if self.event == 0x24 and self.event == 0x00:
-            _LOGGER.debug(f"Door phone - {self.room_id} opening at {datetime.now()}")
+            _LOGGER.debug("Door phone - %s opening at %s", self.room_id, datetime.now())
             self._force_update.append(
                 Device(
                     device_type=self.device_type,
@@ -854,7 +856,7 @@ class DoorPhonePacket:
                 )
             )
         if self.event == 0x04 and self.event2 == 0x00:
-            _LOGGER.debug(f"Door phone - {self.room_id} exiting at {datetime.now()}")
+            _LOGGER.debug("Door phone - %s exiting at %s", self.room_id, datetime.now())
             self._force_update.append(
                 Device(
                     device_type=self.device_type,
@@ -911,13 +913,13 @@ class DoorPhonePacket:
             make_packet.extend(cmd)
             make_packets.append((make_packet, delay))
 
-        _LOGGER.debug(f"Door phone make packets: {make_packets}")
+        _LOGGER.debug("Door phone make packets: %s", make_packets)
         return make_packets
     
     def make_power_status(self, power: bool, control: str | None) -> list[tuple[bytearray, float | None]]:
         """Make a packet to set the power status of the door phone."""
         if not power:
-            _LOGGER.debug(f"Door phone device is off - {control}. Ignoring power status.")
+            _LOGGER.debug("Door phone device is off - %s. Ignoring power status.", control)
             return
         
         open_packet = [
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorDeviceClass,
@@ -16,10 +18,9 @@ from homeassistant.const import (
     CONCENTRATION_PARTS_PER_MILLION,
     CONCENTRATION_PARTS_PER_BILLION,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, HassJob, HassJobType, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .pywallpad.const import (
     STATE,
@@ -29,13 +30,12 @@ from .pywallpad.const import (
     VOC,
     TEMPERATURE,
     HUMIDITY,
-    FLOOR,
 )
 from .pywallpad.packet import KocomPacket, DeviceType
 
 from .gateway import KocomGateway
 from .entity import KocomEntity
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN
 
 
 async def async_setup_entry(
@@ -47,15 +47,19 @@ async def async_setup_entry(
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
     @callback
-    def async_add_sensor(packet: KocomPacket) -> None:
-        """Add new sensor entity."""
-        async_add_entities([KocomSensorEntity(gateway, packet)])
-    
-    for entity in gateway.get_entities(Platform.SENSOR):
-        async_add_sensor(entity)
-        
+    def async_add_sensor(packets: Iterable[KocomPacket]) -> None:
+        """Add new sensor entities."""
+        async_add_entities([
+            KocomSensorEntity(gateway, packet) for packet in packets
+        ])
+
+    async_add_sensor(gateway.get_entities(Platform.SENSOR))
+
     entry.async_on_unload(
-        async_dispatcher_connect(hass, f"{DOMAIN}_sensor_add", async_add_sensor)
+        gateway.register_platform(
+            Platform.SENSOR,
+            HassJob(async_add_sensor, "kocom add sensor", job_type=HassJobType.Callback),
+        )
     )
 
 
@@ -75,7 +79,7 @@ class KocomSensorEntity(KocomEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        return self.packet._device.state[STATE]
+        return self._device_state[STATE]
     
     @property
     def device_class(self) -> SensorDeviceClass | None:
@@ -2,22 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
 
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, HassJob, HassJobType, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .pywallpad.const import POWER
 from .pywallpad.packet import KocomPacket, DeviceType
 
 from .gateway import KocomGateway
 from .entity import KocomEntity
-from .const import DOMAIN, LOGGER
+from .const import DOMAIN
 
 
 async def async_setup_entry(
@@ -29,15 +29,19 @@ async def async_setup_entry(
     gateway: KocomGateway = hass.data[DOMAIN][entry.entry_id]
     
     @callback
-    def async_add_switch(packet: KocomPacket) -> None:
-        """Add new switch entity."""
-        async_add_entities([KocomSwitchEntity(gateway, packet)])
-    
-    for entity in gateway.get_entities(Platform.SWITCH):
-        async_add_switch(entity)
-        
+    def async_add_switch(packets: Iterable[KocomPacket]) -> None:
+        """Add new switch entities."""
+        async_add_entities([
+            KocomSwitchEntity(gateway, packet) for packet in packets
+        ])
+
+    async_add_switch(gateway.get_entities(Platform.SWITCH))
+
     entry.async_on_unload(
-        async_dispatcher_connect(hass, f"{DOMAIN}_switch_add", async_add_switch)
+        gateway.register_platform(
+            Platform.SWITCH,
+            HassJob(async_add_switch, "kocom add switch", job_type=HassJobType.Callback),
+        )
     )
 
 
@@ -59,7 +63,7 @@ class KocomSwitchEntity(KocomEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return true if the switch is on."""
-        return self.packet._device.state[POWER]
+        return self._device_state[POWER]
     
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on switch."""
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import base64
-import json
 
 def process_string(s: str) -> str:
     """Return as-is if uppercase, else title case."""